@@ -0,0 +1,34 @@
+import os
+import logging
+from pathlib import Path
+
+import uvicorn
+from dotenv import load_dotenv
+
+# Load environment variables
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+logger = logging.getLogger(__name__)
+
+# The app is imported by uvicorn in each worker process rather than here, so
+# server.py's module-level setup runs once per worker.
+if __name__ == "__main__":
+    # Each worker opens its own pool of up to MONGO_MAX_POOL_SIZE connections,
+    # so size WEB_CONCURRENCY to the container's CPU quota, not the host's.
+    workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
+    if workers > 1 and os.environ.get('RATE_LIMIT_BACKEND', 'memory') == 'memory':
+        logger.warning(
+            f"Running {workers} workers with the memory rate limit backend, "
+            f"every rate limit budget is effectively multiplied by {workers}"
+        )
+    uvicorn.run(
+        "server:app",
+        app_dir=str(ROOT_DIR),
+        host=os.environ.get('HOST', '0.0.0.0'),
+        port=int(os.environ.get('PORT', '8001')),
+        workers=workers,
+        proxy_headers=True,
+        forwarded_allow_ips=os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1'),
+        timeout_graceful_shutdown=int(os.environ.get('GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS', '30')),
+    )
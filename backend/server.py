@@ -1,13 +1,28 @@
-from fastapi import FastAPI, APIRouter, HTTPException, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Awaitable, Callable, Tuple
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 import os
 import uuid
+import asyncio
 import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -15,13 +30,390 @@ from dotenv import load_dotenv
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Connection pool monitoring
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Track connection pool usage per server from pymongo pool events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers: Dict[str, Dict[str, int]] = {}
+
+    def _server(self, address) -> Dict[str, int]:
+        key = f"{address[0]}:{address[1]}"
+        if key not in self._servers:
+            self._servers[key] = {"open": 0, "checked_out": 0, "waiting": 0, "checkout_failures": 0}
+        return self._servers[key]
+
+    def _update(self, address, **deltas):
+        with self._lock:
+            server = self._server(address)
+            for field, delta in deltas.items():
+                server[field] = max(server[field] + delta, 0)
+
+    def pool_created(self, event):
+        self._update(event.address)
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        with self._lock:
+            self._servers.pop(f"{event.address[0]}:{event.address[1]}", None)
+
+    def connection_created(self, event):
+        self._update(event.address, open=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._update(event.address, open=-1)
+
+    def connection_check_out_started(self, event):
+        self._update(event.address, waiting=1)
+
+    def connection_check_out_failed(self, event):
+        self._update(event.address, waiting=-1, checkout_failures=1)
+
+    def connection_checked_out(self, event):
+        self._update(event.address, waiting=-1, checked_out=1)
+
+    def connection_checked_in(self, event):
+        self._update(event.address, checked_out=-1)
+
+    def snapshot(self, max_pool_size: int) -> Dict[str, Any]:
+        with self._lock:
+            servers = {address: dict(stats) for address, stats in self._servers.items()}
+        for stats in servers.values():
+            stats["utilization"] = round(stats["checked_out"] / max_pool_size, 3) if max_pool_size else 0.0
+        return {"max_pool_size": max_pool_size, "servers": servers}
+
 # MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '0'))
+MONGO_MAX_STALENESS_SECONDS = int(os.environ.get('MONGO_MAX_STALENESS_SECONDS', '90'))
+
+# pymongo only rejects a too small maxStalenessSeconds at server selection,
+# which would turn every secondary read into a 500
+if MONGO_MAX_STALENESS_SECONDS != -1 and MONGO_MAX_STALENESS_SECONDS < 90:
+    raise ValueError("MONGO_MAX_STALENESS_SECONDS must be -1 (no bound) or at least 90")
+
+pool_monitor = PoolMonitor()
+
+# Read preferences per route group. Writes and read-after-write paths
+# (accept_bid, payments, single document lookups) always use `db` on the
+# primary; list/browse queries may tolerate bounded staleness.
+READ_PREFERENCE_MODES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+ROUTE_READ_PREFERENCES = {
+    "browse": os.environ.get('MONGO_READ_PREFERENCE_BROWSE', 'secondaryPreferred'),
+    "reviews": os.environ.get('MONGO_READ_PREFERENCE_REVIEWS', 'secondaryPreferred'),
+    "payments": os.environ.get('MONGO_READ_PREFERENCE_PAYMENTS', 'primary'),
+}
+
+def make_read_preference(mode: str):
+    """Build a pymongo read preference from its mode name"""
+    if mode not in READ_PREFERENCE_MODES:
+        raise ValueError(f"Unknown read preference mode: {mode}")
+    if mode == "primary":
+        return Primary()
+    return READ_PREFERENCE_MODES[mode](max_staleness=MONGO_MAX_STALENESS_SECONDS)
+
+# The client is created per worker process by the app lifespan, so that no
+# connection pool is shared across a fork.
+client: Optional[AsyncIOMotorClient] = None
+db = None
+read_dbs: Dict[str, Any] = {}
+
+def connect_db():
+    """Create the MongoDB client and database handles for this process"""
+    global client, db, read_dbs
+    client = AsyncIOMotorClient(
+        os.environ['MONGO_URL'],
+        maxPoolSize=MONGO_MAX_POOL_SIZE,
+        minPoolSize=MONGO_MIN_POOL_SIZE,
+        connectTimeoutMS=int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', '10000')),
+        socketTimeoutMS=int(os.environ.get('MONGO_SOCKET_TIMEOUT_MS', '30000')),
+        serverSelectionTimeoutMS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '10000')),
+        waitQueueTimeoutMS=int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '5000')),
+        event_listeners=[pool_monitor],
+    )
+    db = client[os.environ['DB_NAME']]
+    read_dbs = {
+        group: db.with_options(read_preference=make_read_preference(mode))
+        for group, mode in ROUTE_READ_PREFERENCES.items()
+    }
+
+def read_db(group: str):
+    """Database handle for the given route group, falling back to the primary"""
+    return read_dbs.get(group, db)
+
+# Indexes backing the lookups and list filters used by the routes below
+INDEXES = {
+    "users": [[("id", 1)]],
+    "requests": [[("id", 1)], [("student_id", 1)], [("status", 1), ("subject", 1)]],
+    "bids": [[("id", 1)], [("request_id", 1), ("tutor_id", 1)], [("tutor_id", 1)]],
+    "payments": [[("id", 1)], [("student_id", 1)], [("tutor_id", 1)]],
+    "reviews": [[("reviewee_id", 1)]],
+    "outbox": [[("id", 1)], [("status", 1), ("available_at", 1)], [("status", 1), ("lease_until", 1)]],
+}
+
+async def ensure_indexes():
+    for collection, indexes in INDEXES.items():
+        for keys in indexes:
+            await db[collection].create_index(keys)
+    await db.outbox.create_index([("processed_at", 1)], expireAfterSeconds=OUTBOX_RETENTION_SECONDS)
+
+async def supports_transactions() -> bool:
+    """Multi-document transactions need a replica set or a sharded cluster"""
+    hello = await client.admin.command('hello')
+    return "setName" in hello or hello.get("msg") == "isdbgrid"
+
+async def run_write(callback: Callable[[Any], Awaitable[Any]]):
+    """Run callback(session) in a transaction, or with no session on a standalone server
+
+    with_transaction retries the callback on TransientTransactionError (e.g.
+    write conflicts) and the commit on UnknownTransactionCommitResult.
+    """
+    if not app_state["transactions"]:
+        return await callback(None)
+    async with await client.start_session() as session:
+        return await session.with_transaction(callback)
+
+# Rate limiting
+# Per-route-group token bucket budgets as "rate_per_second,burst". With the
+# memory backend each worker process keeps its own buckets, so the effective
+# budget is multiplied by the number of workers; use RATE_LIMIT_BACKEND=redis
+# to enforce it across workers.
+# Every request is charged to a bucket for its client IP, and additionally to
+# one for the student/tutor id when the route takes one. Behind a reverse proxy
+# the client IP comes from X-Forwarded-For, which uvicorn only trusts from the
+# addresses in FORWARDED_ALLOW_IPS (see main.py); without it every caller
+# shares the proxy's bucket.
+
+RATE_LIMITS = {
+    group: tuple(float(part) for part in os.environ.get(f'RATE_LIMIT_{group.upper()}', default).split(','))
+    for group, default in {
+        "browse": "5,20",
+        "lookup": "10,40",
+        "write": "2,10",
+        "payments": "1,5",
+    }.items()
+}
+
+class MemoryTokenBucketStore:
+    """Process-local token buckets, suitable for a single worker
+
+    Buckets are kept in least recently used order, so evicting idle buckets
+    and enforcing the size cap only ever pops from the front.
+    """
+
+    def __init__(
+        self,
+        max_buckets: int = int(os.environ.get('RATE_LIMIT_MAX_BUCKETS', '10000')),
+        idle_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_buckets = max_buckets
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def acquire(self, key: str, rate: float, burst: float) -> float:
+        """Take one token, returning 0 on success or the seconds to wait otherwise"""
+        now = self._clock()
+        tokens, last = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - last) * rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        self._evict(now)
+        return retry_after
+
+    def _evict(self, now: float):
+        # Buckets idle long enough to have refilled carry no state worth keeping
+        while self._buckets:
+            _, last = next(iter(self._buckets.values()))
+            if len(self._buckets) <= self.max_buckets and now - last <= self.idle_seconds:
+                break
+            self._buckets.popitem(last=False)
+
+class RedisTokenBucketStore:
+    """Token buckets shared between workers through Redis"""
+
+    SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1]) or burst
+local ts = tonumber(data[2]) or now
+tokens = math.min(burst, tokens + math.max(now - ts, 0) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(retry_after)
+"""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis  # optional dependency, only needed for this backend
+        self._redis = redis.from_url(url)
+        self._script = self._redis.register_script(self.SCRIPT)
+
+    async def acquire(self, key: str, rate: float, burst: float) -> float:
+        try:
+            result = await self._script(keys=[f"ratelimit:{key}"], args=[rate, burst, time.time()])
+        except Exception as exc:
+            # Fail open: an unavailable limiter must not take the API down with it
+            logger.warning(f"Rate limit backend unavailable: {exc}")
+            return 0.0
+        return float(result)
+
+def create_bucket_store():
+    backend = os.environ.get('RATE_LIMIT_BACKEND', 'memory')
+    if backend == 'redis':
+        return RedisTokenBucketStore(os.environ.get('REDIS_URL', 'redis://localhost:6379/0'))
+    if backend != 'memory':
+        raise ValueError(f"Unknown rate limit backend: {backend}")
+    return MemoryTokenBucketStore()
+
+# Admission control
+class ConcurrencyLimiter:
+    """Bound in-flight database work per process, keeping headroom for critical routes"""
+
+    def __init__(self, max_in_flight: int, critical_reserve: int):
+        self.max_in_flight = max_in_flight
+        self.critical_reserve = critical_reserve
+        self.in_flight = 0
+        self.shed = 0
+
+    def try_acquire(self, critical: bool = False) -> bool:
+        limit = self.max_in_flight + (self.critical_reserve if critical else 0)
+        if self.in_flight >= limit:
+            self.shed += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self):
+        self.in_flight -= 1
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "critical_reserve": self.critical_reserve,
+            "shed": self.shed,
+        }
+
+ADMISSION_RETRY_AFTER_SECONDS = int(os.environ.get('ADMISSION_RETRY_AFTER_SECONDS', '1'))
+
+bucket_store = create_bucket_store()
+concurrency_limiter = ConcurrencyLimiter(
+    max_in_flight=int(os.environ.get('ADMISSION_MAX_IN_FLIGHT', str(MONGO_MAX_POOL_SIZE))),
+    critical_reserve=int(os.environ.get('ADMISSION_CRITICAL_RESERVE', '10')),
+)
+
+def client_keys(request: Request) -> List[str]:
+    """Bucket keys to charge: always the client IP, plus the student/tutor id the route takes
+
+    Rotating the id therefore never escapes the IP bucket, and only identity
+    parameters declared by the matched route count.
+    """
+    keys = [f"ip:{request.client.host if request.client else 'unknown'}"]
+    route = request.scope.get("route")
+    declared = {param.name for param in route.dependant.query_params} if route else set()
+    for param in ("student_id", "tutor_id"):
+        if param in declared and request.query_params.get(param):
+            keys.append(f"{param}:{request.query_params[param]}")
+            break
+    return keys
+
+def admission(group: str, critical: bool = False):
+    """Dependency enforcing the group's rate limit and the in-flight DB work limit"""
+    async def dependency(request: Request):
+        rate, burst = RATE_LIMITS[group]
+        if rate > 0:
+            retry_after = 0.0
+            for key in client_keys(request):
+                retry_after = max(retry_after, await bucket_store.acquire(f"{group}:{key}", rate, burst))
+            if retry_after > 0:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Rate limit exceeded",
+                    headers={"Retry-After": str(math.ceil(retry_after))}
+                )
+        if not concurrency_limiter.try_acquire(critical):
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, please retry",
+                headers={"Retry-After": str(ADMISSION_RETRY_AFTER_SECONDS)}
+            )
+        try:
+            yield
+        finally:
+            concurrency_limiter.release()
+
+    return dependency
+
+# Application lifecycle
+READINESS_TIMEOUT_SECONDS = float(os.environ.get('READINESS_TIMEOUT_SECONDS', '2'))
+
+app_state = {"ready": False, "transactions": False}
+
+async def ping_db() -> bool:
+    try:
+        await asyncio.wait_for(client.admin.command('ping'), READINESS_TIMEOUT_SECONDS)
+    except Exception as exc:
+        logger.warning(f"MongoDB ping failed: {exc}")
+        return False
+    return True
+
+# uvicorn drains in-flight requests (up to the timeout configured in main.py)
+# and stops accepting connections before the shutdown half of the lifespan
+# runs, so only the resources have to be released here.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global outbox_worker
+    connect_db()
+    await ensure_indexes()
+    app_state["transactions"] = await supports_transactions()
+    if not app_state["transactions"]:
+        logger.warning("MongoDB does not support transactions, outbox events are written without one")
+    if OUTBOX_WORKER_ENABLED:
+        outbox_worker = OutboxWorker(db, outbox_handlers)
+        outbox_worker.start()
+    app_state["ready"] = True
+    logger.info(f"Worker {os.getpid()} ready")
+    try:
+        yield
+    finally:
+        if outbox_worker:
+            await outbox_worker.stop()
+        client.close()
 
 # Create the main app
-app = FastAPI(title="Tutorly API", version="1.0.0")
+app = FastAPI(title="Tutorly API", version="1.0.0", lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -65,6 +457,17 @@ class PaymentStatus(str, Enum):
     RELEASED = "released"
     REFUNDED = "refunded"
 
+class OutboxEventType(str, Enum):
+    BID_ACCEPTED = "bid_accepted"
+    PAYMENT_RELEASED = "payment_released"
+    REVIEW_CREATED = "review_created"
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    DEAD = "dead"
+
 # Helper functions
 def prepare_for_mongo(data: dict) -> dict:
     """Prepare data for MongoDB storage"""
@@ -177,6 +580,216 @@ class Review(BaseModel):
     comment: str
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+# Transactional outbox
+# Side effects (notifications, emails, payment providers) are recorded as
+# outbox events in the same write as the state change and dispatched by
+# OutboxWorker, so request latency does not depend on downstream services.
+# Outbox timestamps are stored as BSON dates rather than ISO strings because
+# the worker compares them in queries. Done and dead events are removed by a
+# TTL index on processed_at after OUTBOX_RETENTION_SECONDS.
+OutboxHandler = Callable[[dict], Awaitable[None]]
+
+OUTBOX_WORKER_ENABLED = os.environ.get('OUTBOX_WORKER_ENABLED', 'true').lower() == 'true'
+OUTBOX_RETENTION_SECONDS = int(os.environ.get('OUTBOX_RETENTION_SECONDS', str(7 * 24 * 3600)))
+
+outbox_handlers: Dict[str, List[OutboxHandler]] = {}
+outbox_worker = None
+
+def register_outbox_handler(event_type: OutboxEventType, handler: OutboxHandler):
+    outbox_handlers.setdefault(event_type.value, []).append(handler)
+
+async def enqueue_event(event_type: OutboxEventType, payload: dict, session=None):
+    """Record an outbox event, as part of the caller's transaction when given a session"""
+    now = datetime.now(timezone.utc)
+    await db.outbox.insert_one({
+        "id": str(uuid.uuid4()),
+        "type": event_type.value,
+        "payload": payload,
+        "status": OutboxStatus.PENDING.value,
+        "attempts": 0,
+        "available_at": now,
+        "lease_until": None,
+        "owner": None,
+        "last_error": None,
+        "created_at": now,
+        "updated_at": now,
+    }, session=session)
+
+class OutboxWorker:
+    """Claim outbox events in leased batches and dispatch them to handlers
+
+    Takes the database and handler mapping explicitly so it can be driven with
+    fake handlers through run_once() without starting the background tasks.
+    """
+
+    def __init__(
+        self,
+        database,
+        handlers: Dict[str, List[OutboxHandler]],
+        concurrency: int = int(os.environ.get('OUTBOX_CONCURRENCY', '2')),
+        batch_size: int = int(os.environ.get('OUTBOX_BATCH_SIZE', '20')),
+        lease_seconds: float = float(os.environ.get('OUTBOX_LEASE_SECONDS', '30')),
+        lease_margin_seconds: float = float(os.environ.get('OUTBOX_LEASE_MARGIN_SECONDS', '5')),
+        poll_interval: float = float(os.environ.get('OUTBOX_POLL_INTERVAL_SECONDS', '1')),
+        max_attempts: int = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '8')),
+        base_backoff: float = float(os.environ.get('OUTBOX_BASE_BACKOFF_SECONDS', '2')),
+        max_backoff: float = float(os.environ.get('OUTBOX_MAX_BACKOFF_SECONDS', '300')),
+    ):
+        self.database = database
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.lease_margin_seconds = lease_margin_seconds
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    async def dead_letter_expired(self, now: datetime):
+        """Give up on events whose lease expired on their last allowed attempt"""
+        await self.database.outbox.update_many(
+            {
+                "status": OutboxStatus.PROCESSING.value,
+                "lease_until": {"$lte": now},
+                "attempts": {"$gte": self.max_attempts},
+            },
+            {"$set": {
+                "status": OutboxStatus.DEAD.value,
+                "lease_until": None,
+                "last_error": "lease expired on final attempt",
+                "processed_at": now,
+                "updated_at": now,
+            }},
+        )
+
+    async def claim(self, query: dict, sort_field: str, limit: int, now: datetime) -> List[dict]:
+        """Lease up to limit events matching query with one update for the whole batch"""
+        candidates = await self.database.outbox.find(query, {"id": 1}).sort(sort_field, 1).limit(limit).to_list(limit)
+        if not candidates:
+            return []
+        ids = [candidate["id"] for candidate in candidates]
+        # Concurrent workers may pick the same candidates; re-applying the query
+        # in the update lets exactly one of them win each event.
+        owner = f"{self.worker_id}:{uuid.uuid4().hex[:8]}"
+        await self.database.outbox.update_many(
+            {**query, "id": {"$in": ids}},
+            {
+                "$set": {
+                    "status": OutboxStatus.PROCESSING.value,
+                    "lease_until": now + timedelta(seconds=self.lease_seconds),
+                    "owner": owner,
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+        )
+        return await self.database.outbox.find({"id": {"$in": ids}, "owner": owner}).to_list(limit)
+
+    async def claim_batch(self) -> List[dict]:
+        """Lease up to batch_size due events, reclaiming expired leases first"""
+        now = datetime.now(timezone.utc)
+        await self.dead_letter_expired(now)
+        events = await self.claim(
+            {
+                "status": OutboxStatus.PROCESSING.value,
+                "lease_until": {"$lte": now},
+                "attempts": {"$lt": self.max_attempts},
+            },
+            "lease_until", self.batch_size, now,
+        )
+        if len(events) < self.batch_size:
+            events += await self.claim(
+                {"status": OutboxStatus.PENDING.value, "available_at": {"$lte": now}},
+                "available_at", self.batch_size - len(events), now,
+            )
+        return events
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.max_backoff, self.base_backoff * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def lease_deadline(self) -> float:
+        """Monotonic time by which handlers must finish for a lease taken now"""
+        return time.monotonic() + self.lease_seconds - self.lease_margin_seconds
+
+    async def dispatch(self, event: dict):
+        for handler in self.handlers.get(event["type"], []):
+            await handler(event)
+
+    async def process(self, event: dict, deadline: Optional[float] = None):
+        """Run the event's handlers, bounded by the lease so it is never dispatched twice at once"""
+        if deadline is None:
+            deadline = self.lease_deadline()
+        owned = {"id": event["id"], "owner": event["owner"], "status": OutboxStatus.PROCESSING.value}
+        try:
+            await asyncio.wait_for(self.dispatch(event), max(deadline - time.monotonic(), 0))
+        except Exception as exc:
+            now = datetime.now(timezone.utc)
+            if event["attempts"] >= self.max_attempts:
+                logger.error(f"Outbox event {event['id']} ({event['type']}) failed permanently: {exc}")
+                updates = {"status": OutboxStatus.DEAD.value, "processed_at": now}
+            else:
+                logger.warning(f"Outbox event {event['id']} ({event['type']}) failed, retrying: {exc}")
+                updates = {
+                    "status": OutboxStatus.PENDING.value,
+                    "available_at": now + timedelta(seconds=self.backoff(event["attempts"])),
+                }
+            updates.update({"lease_until": None, "last_error": str(exc) or type(exc).__name__, "updated_at": now})
+            await self.database.outbox.update_one(owned, {"$set": updates})
+            return
+        now = datetime.now(timezone.utc)
+        await self.database.outbox.update_one(owned, {"$set": {
+            "status": OutboxStatus.DONE.value,
+            "lease_until": None,
+            "processed_at": now,
+            "updated_at": now,
+        }})
+
+    async def run_once(self) -> int:
+        """Claim and dispatch one batch, returning the number of events handled"""
+        # Taken before claiming, so it is never later than the leases being set
+        deadline = self.lease_deadline()
+        events = await self.claim_batch()
+        results = await asyncio.gather(
+            *(self.process(event, deadline) for event in events),
+            return_exceptions=True
+        )
+        for event, result in zip(events, results):
+            if isinstance(result, Exception):
+                logger.error(f"Outbox event {event['id']} ({event['type']}) could not be settled: {result}")
+        return len(events)
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                handled = await self.run_once()
+            except Exception as exc:
+                logger.error(f"Outbox worker error: {exc}")
+                handled = 0
+            if not handled:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self):
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        """Let in-progress batches finish; unfinished leases are reclaimed after expiry"""
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+async def log_event(event: dict):
+    logger.info(f"Outbox event {event['type']}: {event['payload']}")
+
+for event_type in OutboxEventType:
+    register_outbox_handler(event_type, log_event)
+
 # API Routes
 
 @api_router.get("/")
@@ -184,7 +797,7 @@ async def root():
     return {"message": "Tutorly API is running!"}
 
 # User routes
-@api_router.post("/users", response_model=User)
+@api_router.post("/users", response_model=User, dependencies=[Depends(admission("write"))])
 async def create_user(user_data: UserCreate):
     user_dict = user_data.dict()
     user_obj = User(**user_dict)
@@ -192,7 +805,7 @@ async def create_user(user_data: UserCreate):
     await db.users.insert_one(prepared_data)
     return user_obj
 
-@api_router.get("/users/{user_id}", response_model=User)
+@api_router.get("/users/{user_id}", response_model=User, dependencies=[Depends(admission("lookup"))])
 async def get_user(user_id: str):
     user = await db.users.find_one({"id": user_id})
     if not user:
@@ -200,7 +813,7 @@ async def get_user(user_id: str):
     parsed_user = parse_from_mongo(user)
     return User(**parsed_user)
 
-@api_router.put("/users/{user_id}", response_model=User)
+@api_router.put("/users/{user_id}", response_model=User, dependencies=[Depends(admission("write"))])
 async def update_user(user_id: str, updates: dict):
     updates["updated_at"] = datetime.now(timezone.utc)
     prepared_updates = prepare_for_mongo(updates)
@@ -218,7 +831,7 @@ async def update_user(user_id: str, updates: dict):
     return User(**parsed_user)
 
 # Request routes
-@api_router.post("/requests", response_model=TutoringRequest)
+@api_router.post("/requests", response_model=TutoringRequest, dependencies=[Depends(admission("write"))])
 async def create_request(request_data: RequestCreate, student_id: str):
     request_dict = request_data.dict()
     request_dict["student_id"] = student_id
@@ -227,7 +840,7 @@ async def create_request(request_data: RequestCreate, student_id: str):
     await db.requests.insert_one(prepared_data)
     return request_obj
 
-@api_router.get("/requests", response_model=List[TutoringRequest])
+@api_router.get("/requests", response_model=List[TutoringRequest], dependencies=[Depends(admission("browse"))])
 async def get_requests(
     status: Optional[RequestStatus] = None,
     subject: Optional[str] = None,
@@ -242,11 +855,11 @@ async def get_requests(
     if student_id:
         query["student_id"] = student_id
     
-    requests = await db.requests.find(query).limit(limit).to_list(limit)
+    requests = await read_db("browse").requests.find(query).limit(limit).to_list(limit)
     parsed_requests = [parse_from_mongo(req) for req in requests]
     return [TutoringRequest(**req) for req in parsed_requests]
 
-@api_router.get("/requests/{request_id}", response_model=TutoringRequest)
+@api_router.get("/requests/{request_id}", response_model=TutoringRequest, dependencies=[Depends(admission("lookup"))])
 async def get_request(request_id: str):
     request = await db.requests.find_one({"id": request_id})
     if not request:
@@ -254,7 +867,7 @@ async def get_request(request_id: str):
     parsed_request = parse_from_mongo(request)
     return TutoringRequest(**parsed_request)
 
-@api_router.put("/requests/{request_id}", response_model=TutoringRequest)
+@api_router.put("/requests/{request_id}", response_model=TutoringRequest, dependencies=[Depends(admission("write"))])
 async def update_request(request_id: str, updates: dict):
     updates["updated_at"] = datetime.now(timezone.utc)
     prepared_updates = prepare_for_mongo(updates)
@@ -272,7 +885,7 @@ async def update_request(request_id: str, updates: dict):
     return TutoringRequest(**parsed_request)
 
 # Bid routes
-@api_router.post("/bids", response_model=Bid)
+@api_router.post("/bids", response_model=Bid, dependencies=[Depends(admission("write"))])
 async def create_bid(bid_data: BidCreate, tutor_id: str):
     # Check if request exists and is active
     request = await db.requests.find_one({"id": bid_data.request_id})
@@ -296,7 +909,7 @@ async def create_bid(bid_data: BidCreate, tutor_id: str):
     await db.bids.insert_one(prepared_data)
     return bid_obj
 
-@api_router.get("/bids", response_model=List[Bid])
+@api_router.get("/bids", response_model=List[Bid], dependencies=[Depends(admission("browse"))])
 async def get_bids(
     request_id: Optional[str] = None,
     tutor_id: Optional[str] = None,
@@ -311,11 +924,11 @@ async def get_bids(
     if status:
         query["status"] = status
     
-    bids = await db.bids.find(query).limit(limit).to_list(limit)
+    bids = await read_db("browse").bids.find(query).limit(limit).to_list(limit)
     parsed_bids = [parse_from_mongo(bid) for bid in bids]
     return [Bid(**bid) for bid in parsed_bids]
 
-@api_router.put("/bids/{bid_id}", response_model=Bid)
+@api_router.put("/bids/{bid_id}", response_model=Bid, dependencies=[Depends(admission("write"))])
 async def update_bid(bid_id: str, updates: dict):
     updates["updated_at"] = datetime.now(timezone.utc)
     prepared_updates = prepare_for_mongo(updates)
@@ -332,7 +945,7 @@ async def update_bid(bid_id: str, updates: dict):
     parsed_bid = parse_from_mongo(updated_bid)
     return Bid(**parsed_bid)
 
-@api_router.post("/bids/{bid_id}/accept")
+@api_router.post("/bids/{bid_id}/accept", dependencies=[Depends(admission("payments", critical=True))])
 async def accept_bid(bid_id: str, student_id: str):
     # Get the bid
     bid = await db.bids.find_one({"id": bid_id})
@@ -346,28 +959,6 @@ async def accept_bid(bid_id: str, student_id: str):
     if request["student_id"] != student_id:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    # Update bid status
-    await db.bids.update_one(
-        {"id": bid_id},
-        {"$set": {"status": BidStatus.ACCEPTED, "updated_at": datetime.now(timezone.utc).isoformat()}}
-    )
-    
-    # Update request status and match tutor
-    await db.requests.update_one(
-        {"id": bid["request_id"]},
-        {"$set": {
-            "status": RequestStatus.MATCHED,
-            "matched_tutor_id": bid["tutor_id"],
-            "updated_at": datetime.now(timezone.utc).isoformat()
-        }}
-    )
-    
-    # Reject all other bids for this request
-    await db.bids.update_many(
-        {"request_id": bid["request_id"], "id": {"$ne": bid_id}},
-        {"$set": {"status": BidStatus.REJECTED, "updated_at": datetime.now(timezone.utc).isoformat()}}
-    )
-    
     # Create payment record
     commission_rate = 0.15  # 15% commission
     amount = bid["offered_price"]
@@ -384,12 +975,55 @@ async def accept_bid(bid_id: str, student_id: str):
     )
     
     prepared_payment = prepare_for_mongo(payment.dict())
-    await db.payments.insert_one(prepared_payment)
+    
+    async def write(session):
+        # Match the request only while it is still active, so that of two
+        # concurrent accepts exactly one commits; raising aborts the transaction
+        result = await db.requests.update_one(
+            {"id": bid["request_id"], "status": RequestStatus.ACTIVE},
+            {"$set": {
+                "status": RequestStatus.MATCHED,
+                "matched_tutor_id": bid["tutor_id"],
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }},
+            session=session
+        )
+        if result.matched_count == 0:
+            raise HTTPException(status_code=409, detail="Request is no longer active")
+        
+        # Update bid status
+        result = await db.bids.update_one(
+            {"id": bid_id, "status": {"$in": [BidStatus.PENDING, BidStatus.COUNTER_OFFERED]}},
+            {"$set": {"status": BidStatus.ACCEPTED, "updated_at": datetime.now(timezone.utc).isoformat()}},
+            session=session
+        )
+        if result.matched_count == 0:
+            raise HTTPException(status_code=409, detail="Bid is no longer open")
+        
+        # Reject all other bids for this request
+        await db.bids.update_many(
+            {"request_id": bid["request_id"], "id": {"$ne": bid_id}},
+            {"$set": {"status": BidStatus.REJECTED, "updated_at": datetime.now(timezone.utc).isoformat()}},
+            session=session
+        )
+        
+        await db.payments.insert_one(prepared_payment, session=session)
+        
+        await enqueue_event(OutboxEventType.BID_ACCEPTED, {
+            "bid_id": bid_id,
+            "request_id": bid["request_id"],
+            "student_id": student_id,
+            "tutor_id": bid["tutor_id"],
+            "payment_id": payment.id,
+            "amount": amount
+        }, session=session)
+    
+    await run_write(write)
     
     return {"message": "Bid accepted successfully", "payment_id": payment.id}
 
 # Payment routes
-@api_router.get("/payments", response_model=List[Payment])
+@api_router.get("/payments", response_model=List[Payment], dependencies=[Depends(admission("browse"))])
 async def get_payments(
     student_id: Optional[str] = None,
     tutor_id: Optional[str] = None,
@@ -404,11 +1038,11 @@ async def get_payments(
     if status:
         query["status"] = status
     
-    payments = await db.payments.find(query).limit(limit).to_list(limit)
+    payments = await read_db("payments").payments.find(query).limit(limit).to_list(limit)
     parsed_payments = [parse_from_mongo(payment) for payment in payments]
     return [Payment(**payment) for payment in parsed_payments]
 
-@api_router.post("/payments/{payment_id}/process")
+@api_router.post("/payments/{payment_id}/process", dependencies=[Depends(admission("payments", critical=True))])
 async def process_payment(payment_id: str):
     # Mock payment processing
     result = await db.payments.update_one(
@@ -425,7 +1059,7 @@ async def process_payment(payment_id: str):
     
     return {"message": "Payment processed successfully"}
 
-@api_router.post("/payments/{payment_id}/release")
+@api_router.post("/payments/{payment_id}/release", dependencies=[Depends(admission("payments", critical=True))])
 async def release_payment(payment_id: str):
     # Release payment to tutor after session completion
     payment = await db.payments.find_one({"id": payment_id})
@@ -435,32 +1069,55 @@ async def release_payment(payment_id: str):
     if payment["status"] != PaymentStatus.PAID:
         raise HTTPException(status_code=400, detail="Payment not in paid status")
     
-    # Update payment status
-    await db.payments.update_one(
-        {"id": payment_id},
-        {"$set": {
-            "status": PaymentStatus.RELEASED,
-            "updated_at": datetime.now(timezone.utc).isoformat()
-        }}
-    )
+    async def write(session):
+        # Update payment status
+        await db.payments.update_one(
+            {"id": payment_id},
+            {"$set": {
+                "status": PaymentStatus.RELEASED,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }},
+            session=session
+        )
+        
+        # Update tutor wallet balance
+        await db.users.update_one(
+            {"id": payment["tutor_id"]},
+            {"$inc": {"wallet_balance": payment["tutor_earnings"]}},
+            session=session
+        )
+        
+        await enqueue_event(OutboxEventType.PAYMENT_RELEASED, {
+            "payment_id": payment_id,
+            "request_id": payment["request_id"],
+            "student_id": payment["student_id"],
+            "tutor_id": payment["tutor_id"],
+            "amount": payment["tutor_earnings"]
+        }, session=session)
     
-    # Update tutor wallet balance
-    await db.users.update_one(
-        {"id": payment["tutor_id"]},
-        {"$inc": {"wallet_balance": payment["tutor_earnings"]}}
-    )
+    await run_write(write)
     
     return {"message": "Payment released to tutor"}
 
 # Review routes
-@api_router.post("/reviews", response_model=Review)
+@api_router.post("/reviews", response_model=Review, dependencies=[Depends(admission("write"))])
 async def create_review(review_data: dict):
     review_obj = Review(**review_data)
     prepared_data = prepare_for_mongo(review_obj.dict())
-    await db.reviews.insert_one(prepared_data)
+    async def write(session):
+        await db.reviews.insert_one(prepared_data, session=session)
+        await enqueue_event(OutboxEventType.REVIEW_CREATED, {
+            "review_id": review_obj.id,
+            "request_id": review_obj.request_id,
+            "reviewer_id": review_obj.reviewer_id,
+            "reviewee_id": review_obj.reviewee_id,
+            "rating": review_obj.rating
+        }, session=session)
+    
+    await run_write(write)
     return review_obj
 
-@api_router.get("/reviews", response_model=List[Review])
+@api_router.get("/reviews", response_model=List[Review], dependencies=[Depends(admission("browse"))])
 async def get_reviews(
     reviewee_id: Optional[str] = None,
     limit: int = 50
@@ -469,17 +1126,39 @@ async def get_reviews(
     if reviewee_id:
         query["reviewee_id"] = reviewee_id
     
-    reviews = await db.reviews.find(query).limit(limit).to_list(limit)
+    reviews = await read_db("reviews").reviews.find(query).limit(limit).to_list(limit)
     parsed_reviews = [parse_from_mongo(review) for review in reviews]
     return [Review(**review) for review in parsed_reviews]
 
-# Include the router in the main app
-app.include_router(api_router)
+# Health routes
+@api_router.get("/health/live")
+async def liveness():
+    return {"status": "alive"}
+
+@api_router.get("/health/ready")
+async def readiness():
+    if not app_state["ready"] or not await ping_db():
+        raise HTTPException(status_code=503, detail="Not ready")
+    return {"status": "ready"}
+
+# Monitoring routes
+@api_router.get("/metrics/pool")
+async def get_pool_metrics():
+    metrics = pool_monitor.snapshot(MONGO_MAX_POOL_SIZE)
+    metrics["read_preferences"] = ROUTE_READ_PREFERENCES
+    metrics["max_staleness_seconds"] = MONGO_MAX_STALENESS_SECONDS
+    return metrics
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+@api_router.get("/metrics/admission")
+async def get_admission_metrics():
+    return concurrency_limiter.snapshot()
 
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+@api_router.get("/metrics/outbox", dependencies=[Depends(admission("lookup"))])
+async def get_outbox_metrics():
+    return {
+        outbox_status.value: await db.outbox.count_documents({"status": outbox_status.value})
+        for outbox_status in OutboxStatus
+    }
+
+# Include the router in the main app
+app.include_router(api_router)
@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import server  # noqa: E402
+
+
+@pytest.fixture
+def mock_db(monkeypatch):
+    """Point the server module at an in-memory database"""
+    database = AsyncMongoMockClient()["tutorly_test"]
+    monkeypatch.setattr(server, "db", database)
+    monkeypatch.setattr(server, "read_dbs", {})
+    monkeypatch.setitem(server.app_state, "transactions", False)
+    monkeypatch.setattr(server, "bucket_store", server.MemoryTokenBucketStore())
+    return database
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def acquire(store, key, rate=1.0, burst=2.0):
+    return asyncio.run(store.acquire(key, rate, burst))
+
+
+@pytest.fixture
+def api(monkeypatch, mock_db):
+    monkeypatch.setattr(server, "concurrency_limiter", server.ConcurrencyLimiter(max_in_flight=10, critical_reserve=2))
+    return TestClient(server.app)
+
+
+def test_token_bucket_allows_burst_then_reports_wait():
+    clock = FakeClock()
+    store = server.MemoryTokenBucketStore(clock=clock)
+    assert acquire(store, "k", rate=2.0, burst=2.0) == 0
+    assert acquire(store, "k", rate=2.0, burst=2.0) == 0
+    assert acquire(store, "k", rate=2.0, burst=2.0) == pytest.approx(0.5)
+
+
+def test_token_bucket_refills_at_rate_up_to_burst():
+    clock = FakeClock()
+    store = server.MemoryTokenBucketStore(clock=clock)
+    acquire(store, "k")
+    acquire(store, "k")
+    clock.now += 1
+    assert acquire(store, "k") == 0
+    assert acquire(store, "k") == pytest.approx(1.0)
+    clock.now += 100
+    assert acquire(store, "k") == 0
+    assert acquire(store, "k") == 0
+    assert acquire(store, "k") > 0
+
+
+def test_token_bucket_evicts_least_recently_used_over_cap():
+    clock = FakeClock()
+    store = server.MemoryTokenBucketStore(max_buckets=3, clock=clock)
+    for key in ("a", "b", "c"):
+        acquire(store, key)
+    acquire(store, "a")
+    acquire(store, "d")
+    assert len(store) == 3
+    assert list(store._buckets) == ["c", "a", "d"]
+
+
+def test_token_bucket_evicts_idle_buckets():
+    clock = FakeClock()
+    store = server.MemoryTokenBucketStore(idle_seconds=60, clock=clock)
+    acquire(store, "a")
+    clock.now += 61
+    acquire(store, "b")
+    assert list(store._buckets) == ["b"]
+
+
+def test_concurrency_limiter_keeps_reserve_for_critical_routes():
+    limiter = server.ConcurrencyLimiter(max_in_flight=2, critical_reserve=1)
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert limiter.try_acquire(critical=True)
+    assert not limiter.try_acquire(critical=True)
+    assert limiter.snapshot()["shed"] == 2
+    limiter.release()
+    assert limiter.try_acquire(critical=True)
+
+
+def test_rate_limited_route_returns_429_with_retry_after(api, monkeypatch):
+    monkeypatch.setitem(server.RATE_LIMITS, "browse", (1.0, 3.0))
+    statuses = [api.get("/api/reviews").status_code for _ in range(4)]
+    assert statuses == [200, 200, 200, 429]
+    response = api.get("/api/reviews")
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_undeclared_identity_param_does_not_open_new_bucket(api, monkeypatch):
+    monkeypatch.setitem(server.RATE_LIMITS, "browse", (1.0, 3.0))
+    statuses = [api.get("/api/reviews", params={"student_id": f"x{i}"}).status_code for i in range(4)]
+    assert statuses == [200, 200, 200, 429]
+
+
+def test_rotating_declared_identity_param_still_hits_ip_bucket(api, monkeypatch):
+    monkeypatch.setitem(server.RATE_LIMITS, "browse", (1.0, 3.0))
+    statuses = [
+        api.get("/api/requests", params={"limit": 50, "student_id": f"x{i}"}).status_code
+        for i in range(4)
+    ]
+    assert statuses == [200, 200, 200, 429]
+
+
+def test_declared_identity_param_is_charged_its_own_bucket(api, monkeypatch):
+    monkeypatch.setitem(server.RATE_LIMITS, "browse", (1.0, 1.0))
+    assert api.get("/api/bids", params={"tutor_id": "a"}).status_code == 200
+    assert asyncio.run(server.bucket_store.acquire("browse:tutor_id:a", 1.0, 1.0)) > 0
+
+
+def test_forwarded_client_ip_is_used_from_trusted_proxy(mock_db, monkeypatch):
+    from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+    monkeypatch.setitem(server.RATE_LIMITS, "browse", (1.0, 1.0))
+    proxied = TestClient(ProxyHeadersMiddleware(server.app, trusted_hosts="testclient"))
+    for client_ip in ("203.0.113.1", "203.0.113.2"):
+        response = proxied.get("/api/reviews", headers={"X-Forwarded-For": client_ip})
+        assert response.status_code == 200
+    response = proxied.get("/api/reviews", headers={"X-Forwarded-For": "203.0.113.1"})
+    assert response.status_code == 429
+
+
+def test_overloaded_route_returns_503_with_retry_after(api, monkeypatch):
+    monkeypatch.setattr(server, "concurrency_limiter", server.ConcurrencyLimiter(max_in_flight=0, critical_reserve=0))
+    response = api.get("/api/reviews")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(server.ADMISSION_RETRY_AFTER_SECONDS)
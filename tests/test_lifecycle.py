@@ -0,0 +1,38 @@
+from fastapi.testclient import TestClient
+from mongomock_motor import AsyncMongoMockClient
+
+import server
+
+
+def test_ready_is_503_before_lifespan(monkeypatch):
+    monkeypatch.setitem(server.app_state, "ready", False)
+    response = TestClient(server.app).get("/api/health/ready")
+    assert response.status_code == 503
+
+
+def test_ready_is_503_when_ping_fails(monkeypatch):
+    async def failing_ping():
+        return False
+
+    monkeypatch.setitem(server.app_state, "ready", True)
+    monkeypatch.setattr(server, "ping_db", failing_ping)
+    response = TestClient(server.app).get("/api/health/ready")
+    assert response.status_code == 503
+
+
+def test_live_and_ready_after_lifespan_startup(monkeypatch):
+    async def no_transactions():
+        return False
+
+    monkeypatch.setattr(server, "AsyncIOMotorClient", lambda *args, **kwargs: AsyncMongoMockClient())
+    monkeypatch.setattr(server, "supports_transactions", no_transactions)
+    monkeypatch.setattr(server, "OUTBOX_WORKER_ENABLED", False)
+    monkeypatch.setitem(server.app_state, "ready", False)
+    # connect_db() rebinds these module globals; let monkeypatch restore them
+    for name in ("client", "db", "read_dbs"):
+        monkeypatch.setattr(server, name, getattr(server, name))
+    with TestClient(server.app) as client:
+        assert client.get("/api/health/live").json() == {"status": "alive"}
+        response = client.get("/api/health/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
@@ -0,0 +1,202 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+
+class FakeHandler:
+    """Records dispatched events, failing the first `failures` calls"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.events = []
+
+    async def __call__(self, event):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("downstream unavailable")
+        self.events.append(event)
+
+
+def make_worker(database, handler, **options):
+    options.setdefault("max_attempts", 3)
+    return server.OutboxWorker(
+        database,
+        {event_type.value: [handler] for event_type in server.OutboxEventType},
+        **options,
+    )
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def utcnow():
+    # mongomock hands dates back as naive UTC, like pymongo without tz_aware
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def enqueue(event_type=server.OutboxEventType.BID_ACCEPTED, payload=None):
+    run(server.enqueue_event(event_type, payload or {"bid_id": "b1"}))
+
+
+def outbox_events(database):
+    async def fetch():
+        return await database.outbox.find().to_list(None)
+    return run(fetch())
+
+
+def test_successful_event_is_marked_done(mock_db):
+    enqueue()
+    handler = FakeHandler()
+    assert run(make_worker(mock_db, handler).run_once()) == 1
+    assert [event["payload"] for event in handler.events] == [{"bid_id": "b1"}]
+    [event] = outbox_events(mock_db)
+    assert event["status"] == server.OutboxStatus.DONE.value
+    assert event["attempts"] == 1
+    assert event["processed_at"] is not None
+
+
+def test_failed_event_is_rescheduled_with_backoff(mock_db):
+    enqueue()
+    before = utcnow()
+    run(make_worker(mock_db, FakeHandler(failures=1), base_backoff=10).run_once())
+    [event] = outbox_events(mock_db)
+    assert event["status"] == server.OutboxStatus.PENDING.value
+    assert event["last_error"] == "downstream unavailable"
+    assert event["available_at"] >= before + timedelta(seconds=5)
+    assert event["lease_until"] is None
+
+
+def test_event_is_dead_lettered_after_max_attempts(mock_db):
+    enqueue()
+    worker = make_worker(mock_db, FakeHandler(failures=3), base_backoff=0, max_attempts=2)
+    run(worker.run_once())
+    run(worker.run_once())
+    [event] = outbox_events(mock_db)
+    assert event["status"] == server.OutboxStatus.DEAD.value
+    assert event["attempts"] == 2
+    assert run(worker.run_once()) == 0
+
+
+def test_expired_lease_is_reclaimed(mock_db):
+    enqueue()
+    crashed = make_worker(mock_db, FakeHandler(), lease_seconds=30)
+    [claimed] = run(crashed.claim_batch())
+    run(mock_db.outbox.update_one({"id": claimed["id"]}, {"$set": {"lease_until": utcnow() - timedelta(seconds=1)}}))
+
+    handler = FakeHandler()
+    assert run(make_worker(mock_db, handler).run_once()) == 1
+    assert len(handler.events) == 1
+    [event] = outbox_events(mock_db)
+    assert event["status"] == server.OutboxStatus.DONE.value
+    assert event["attempts"] == 2
+
+
+def test_live_lease_is_not_reclaimed(mock_db):
+    enqueue()
+    run(make_worker(mock_db, FakeHandler()).claim_batch())
+    assert run(make_worker(mock_db, FakeHandler()).claim_batch()) == []
+
+
+def test_expired_lease_on_final_attempt_is_dead_lettered_at_claim(mock_db):
+    enqueue()
+    worker = make_worker(mock_db, FakeHandler(), max_attempts=1)
+    [claimed] = run(worker.claim_batch())
+    run(mock_db.outbox.update_one({"id": claimed["id"]}, {"$set": {"lease_until": utcnow() - timedelta(seconds=1)}}))
+
+    handler = FakeHandler()
+    assert run(make_worker(mock_db, handler, max_attempts=1).run_once()) == 0
+    assert handler.events == []
+    [event] = outbox_events(mock_db)
+    assert event["status"] == server.OutboxStatus.DEAD.value
+
+
+def test_claim_batch_respects_batch_size(mock_db):
+    for i in range(5):
+        enqueue(payload={"bid_id": f"b{i}"})
+    worker = make_worker(mock_db, FakeHandler(), batch_size=3)
+    assert len(run(worker.claim_batch())) == 3
+    assert len(run(worker.claim_batch())) == 2
+
+
+def test_create_review_writes_outbox_event(mock_db):
+    review = {
+        "request_id": "r1",
+        "reviewer_id": "s1",
+        "reviewee_id": "t1",
+        "rating": 5,
+        "comment": "Great session",
+    }
+    response = TestClient(server.app).post("/api/reviews", json=review)
+    assert response.status_code == 200
+    [event] = outbox_events(mock_db)
+    assert event["type"] == server.OutboxEventType.REVIEW_CREATED.value
+    assert event["payload"]["review_id"] == response.json()["id"]
+
+
+def test_slow_handlers_are_cut_off_before_the_lease_expires(mock_db):
+    async def slow(event):
+        await asyncio.sleep(0.2)
+
+    enqueue()
+    worker = server.OutboxWorker(
+        mock_db,
+        {server.OutboxEventType.BID_ACCEPTED.value: [slow, slow, slow]},
+        lease_seconds=0.5,
+        lease_margin_seconds=0.2,
+    )
+    run(worker.run_once())
+    [event] = outbox_events(mock_db)
+    assert event["status"] == server.OutboxStatus.PENDING.value
+    assert event["last_error"] == "TimeoutError"
+
+
+def test_run_once_settles_the_batch_when_one_event_fails(mock_db):
+    class FlakyWorker(server.OutboxWorker):
+        async def process(self, event, deadline=None):
+            if event["payload"]["bid_id"] == "b0":
+                raise RuntimeError("database unavailable")
+            await super().process(event, deadline)
+
+    for i in range(3):
+        enqueue(payload={"bid_id": f"b{i}"})
+    handler = FakeHandler()
+    worker = FlakyWorker(mock_db, {server.OutboxEventType.BID_ACCEPTED.value: [handler]})
+    assert run(worker.run_once()) == 3
+    assert sorted(event["payload"]["bid_id"] for event in handler.events) == ["b1", "b2"]
+
+
+def test_accepting_a_matched_request_again_is_rejected(mock_db):
+    api = TestClient(server.app)
+    request = api.post("/api/requests", params={"student_id": "s1"}, json={
+        "subject": "Mathematics",
+        "topic": "Calculus",
+        "description": "Derivatives",
+        "duration_hours": 2,
+        "preferred_price": 100000,
+        "max_price": 150000,
+        "session_date": "2026-12-20T10:00:00Z",
+        "location": "online",
+    }).json()
+    bids = [
+        api.post("/api/bids", params={"tutor_id": tutor_id}, json={
+            "request_id": request["id"],
+            "offered_price": 120000,
+            "message": "I can help",
+            "estimated_duration": 2,
+        }).json()
+        for tutor_id in ("t1", "t2")
+    ]
+
+    assert api.post(f"/api/bids/{bids[0]['id']}/accept", params={"student_id": "s1"}).status_code == 200
+    assert api.post(f"/api/bids/{bids[0]['id']}/accept", params={"student_id": "s1"}).status_code == 409
+    assert api.post(f"/api/bids/{bids[1]['id']}/accept", params={"student_id": "s1"}).status_code == 409
+
+    assert run(mock_db.payments.count_documents({})) == 1
+    [event] = outbox_events(mock_db)
+    assert event["type"] == server.OutboxEventType.BID_ACCEPTED.value
+    assert event["payload"]["tutor_id"] == "t1"